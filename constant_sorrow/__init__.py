@@ -1,16 +1,18 @@
+import sys as _sys
+
 from constant_sorrow.__about__ import __author__, __summary__, __title__, __version__
 __all__ = ["__title__", "__summary__", "__version__", "__author__", ]
 
 
-from bytestring_splitter import BytestringSplitter
 _digest_length = 8
 
-default_constant_splitter = key_splitter = BytestringSplitter((bytes, _digest_length))
-
 
 def constant_or_bytes(possible_constant):
     from .constants import _Constant
     from .constants import _constants_registry_by_hash
+    from .constants import _constants_looked_up_by_hash
+    from .constants import _hash_awaiting_constants
+    from .constants import _constants_registry_lock
     """
     Utility function for getting a constant (that has already been registered) from a serialized constant (ie, bytes of its hash)
     """
@@ -19,8 +21,37 @@ def constant_or_bytes(possible_constant):
     else:
         bytes_of_possible_constant = bytes(possible_constant)
         try:
-            constant = _constants_registry_by_hash[bytes_of_possible_constant]
+            with _constants_registry_lock:
+                _hash_awaiting_constants()
+                constant = _constants_registry_by_hash[bytes_of_possible_constant]
+            _constants_looked_up_by_hash.add(constant._Constant__name)
             result = constant
         except KeyError:
             result = bytes_of_possible_constant
-    return result
\ No newline at end of file
+    return result
+
+
+class __LazyPackage(type(_sys)):
+    """
+    Builds BytestringSplitter, default_constant_splitter and key_splitter (and imports bytestring_splitter)
+    only on first access, so that processes which merely use a few constants for identity don't pay for them.
+    Each is cached on the module once built, so we aren't consulted again for that name.
+    """
+    _lazy_attributes = ("BytestringSplitter", "default_constant_splitter", "key_splitter")
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._lazy_attributes))
+
+    def __getattr__(self, item):
+        if item == "BytestringSplitter":
+            from bytestring_splitter import BytestringSplitter
+            self.BytestringSplitter = BytestringSplitter
+            return BytestringSplitter
+        if item in ("default_constant_splitter", "key_splitter"):
+            self.default_constant_splitter = self.key_splitter = self.BytestringSplitter((bytes, _digest_length))
+            return self.default_constant_splitter
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, item))
+
+
+_sys.modules[__name__].__class__ = __LazyPackage
+del __LazyPackage
@@ -0,0 +1,42 @@
+"""
+Reports on the constants registered in this process as JSON.
+
+    python -m constant_sorrow --import my_package.my_module --largest 5
+
+Constants are created on first access, so import the modules which use them with --import.
+"""
+import argparse
+import importlib
+import json
+import sys
+
+from constant_sorrow.introspection import registry_report
+
+
+def _non_negative_int(value):
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("must be 0 or more, not {}".format(number))
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m constant_sorrow",
+                                     description="Report on the memory and usage of registered constants, as JSON.")
+    parser.add_argument("--import", dest="modules", action="append", default=[], metavar="MODULE",
+                        help="Import MODULE before reporting, registering the constants it uses.  May be repeated.")
+    parser.add_argument("--largest", type=_non_negative_int, default=10,
+                        help="How many of the largest representations to report.  Defaults to 10.")
+    parser.add_argument("--indent", type=int, default=None,
+                        help="Indent the JSON output by this many spaces.")
+    args = parser.parse_args(argv)
+
+    for module in args.modules:
+        importlib.import_module(module)
+
+    json.dump(registry_report(largest=args.largest), sys.stdout, indent=args.indent, sort_keys=True)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
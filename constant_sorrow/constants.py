@@ -1,12 +1,11 @@
-import hashlib
 import sys
-from copy import deepcopy
-from types import ModuleType
+from _thread import allocate_lock
 
 from . import _digest_length
 
 
 def hash_and_truncate(constant):
+    import hashlib  # Deferred, along with deepcopy below, to keep importing constants cheap.
     return hashlib.sha512(constant._Constant__name.encode()).digest()[:_digest_length]
 
 
@@ -53,6 +52,7 @@ class _Constant:
         # Unless there's an explicit repr, we want the str value to be the name.
         if type(self.__repr_content) is None or self.__uses_default_repr:
             self.__has_been_stringified = True
+            _constants_cast.add(self.__name)
             return self.__name
         if type(self.__repr_content) == bytes:
             return self._cast_repr(str, encoding="utf-8")
@@ -141,6 +141,7 @@ class _Constant:
         elif self.__repr_content is representation:
             return self
         else:
+            from copy import deepcopy
             self.__uses_default_repr = False
             self.__repr_content = deepcopy(representation)
 
@@ -194,6 +195,7 @@ class _Constant:
             self.__repr_content = hash_and_truncate(self)
             assert self.__uses_default_repr  # Sanity check: we are indeed using the default repr here.  If this has ever changed, something went wrong.
 
+        _constants_cast.add(self.__name)
         return caster(self.__repr_content, *args, **kwargs)
 
     def bool_value(self, bool_value):
@@ -219,8 +221,32 @@ class _Constant:
 _constants_registry_by_name = {}
 _constants_registry_by_hash = {}
 
+# Constants which haven't yet been hashed into _constants_registry_by_hash.  Hashing is deferred until
+# something looks a constant up by its hash, so that constants used only for identity never need hashlib.
+_constants_awaiting_hash = []
 
-class __ConstantFactory(ModuleType):
+# Held while queueing, draining and reading by hash, so that a lookup never misses a constant which another
+# thread is part way through hashing.
+_constants_registry_lock = allocate_lock()
+
+# Names of constants which have been cast (to bytes, int, str, etc.) or looked up by their hash.
+# Tracked so that introspection can report constants which were created but never used.
+_constants_cast = set()
+_constants_looked_up_by_hash = set()
+
+
+def _hash_awaiting_constants():
+    """
+    Brings _constants_registry_by_hash up to date with every constant registered so far.  Call this before reading it,
+    with _constants_registry_lock held.
+    """
+    # In order, so the latest constant still wins a digest collision.
+    for constant in _constants_awaiting_hash:
+        _constants_registry_by_hash[hash_and_truncate(constant)] = constant
+    del _constants_awaiting_hash[:]
+
+
+class __ConstantFactory(type(sys)):  # ie, types.ModuleType, without importing types.
 
     def __getattr__(self, item):
 
@@ -235,7 +261,8 @@ class __ConstantFactory(ModuleType):
             _constant_class = type(item, (_Constant,), {}) # The actual class of the constant we'll return.
             constant = _constant_class(item)
             _constants_registry_by_name[item.upper()] = constant
-            _constants_registry_by_hash[hash_and_truncate(constant)] = constant
+            with _constants_registry_lock:
+                _constants_awaiting_hash.append(constant)
 
         return constant
 
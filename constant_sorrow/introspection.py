@@ -0,0 +1,89 @@
+import gc
+import heapq
+import sys
+
+from .constants import _constants_registry_by_name, _constants_registry_by_hash, _constants_awaiting_hash, \
+    _constants_cast, _constants_looked_up_by_hash, hash_and_truncate
+
+
+def _class_namespace(constant_class):
+    # constant_class.__dict__ is only a mappingproxy; find the namespace dict behind it.
+    return next(referent for referent in gc.get_referents(constant_class)
+                if type(referent) is dict and referent == constant_class.__dict__)
+
+
+def _size_of_class(constant_class):
+    return sys.getsizeof(constant_class) + sys.getsizeof(_class_namespace(constant_class))
+
+
+def _size_of_instance(constant):
+    # Reading constant.__dict__ would create the dict on Python 3.11+ (where attributes are stored inline until
+    # then), growing the very process we're measuring.  So only count a dict which already exists.
+    size = sys.getsizeof(constant)
+    for referent in gc.get_referents(constant):
+        if type(referent) is dict:
+            size += sys.getsizeof(referent)
+    return size
+
+
+def _size_of_representation(constant):
+    repr_content = constant._Constant__repr_content
+    if repr_content is None:
+        return 0
+    return sys.getsizeof(repr_content)
+
+
+def find_hash_collisions():
+    """
+    Groups every registered constant by its truncated digest and returns those digests which more than
+    one constant shares, as a dict of hex digest -> sorted list of names.
+
+    Only one constant per digest can live in _constants_registry_by_hash, so the others are shadowed there.
+    """
+    by_digest = {}
+    for name, constant in _constants_registry_by_name.items():
+        by_digest.setdefault(hash_and_truncate(constant), []).append(name)
+    return {digest.hex(): sorted(names) for digest, names in by_digest.items() if len(names) > 1}
+
+
+def registry_report(largest=10):
+    """
+    Returns a JSON-serializable dict describing what the registered constants are costing this process:
+    memory (in bytes, as measured by sys.getsizeof) attributed to the dynamic classes, instances, representations,
+    registries and usage tracking, the `largest` representations, constants which were never cast or looked up
+    by hash, and any truncated-digest collisions.
+
+    Reporting doesn't allocate anything which outlives it; in particular, constants awaiting hashing are left
+    in the queue, and registry_by_hash is reported as it stands.
+    """
+    # Generators throughout, rather than per-constant lists of tuples, which CPython would keep on its free lists.
+    constants = list(_constants_registry_by_name.values())
+
+    memory = {
+        "classes": sum(_size_of_class(type(constant)) for constant in constants),
+        "instances": sum(_size_of_instance(constant) for constant in constants),
+        "representations": sum(_size_of_representation(constant) for constant in constants),
+        "registry_by_name": sys.getsizeof(_constants_registry_by_name),
+        "registry_by_hash": sys.getsizeof(_constants_registry_by_hash),
+        "awaiting_hash": sys.getsizeof(_constants_awaiting_hash),
+        "cast": sys.getsizeof(_constants_cast),
+        "looked_up_by_hash": sys.getsizeof(_constants_looked_up_by_hash),
+    }
+    memory["total"] = sum(memory.values())
+
+    largest_representations = heapq.nsmallest(largest, (constant for constant in constants
+                                                        if _size_of_representation(constant)),
+                                              key=lambda constant: (-_size_of_representation(constant),
+                                                                    constant._Constant__name))
+
+    never_used = sorted(name for name in _constants_registry_by_name
+                        if name not in _constants_cast and name not in _constants_looked_up_by_hash)
+
+    return {
+        "count": len(constants),
+        "memory": memory,
+        "largest_representations": [{"name": constant._Constant__name, "size": _size_of_representation(constant)}
+                                    for constant in largest_representations],
+        "never_used": never_used,
+        "hash_collisions": find_hash_collisions(),
+    }
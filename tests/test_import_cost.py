@@ -0,0 +1,129 @@
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import constant_sorrow
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Everything that importing and using a couple of constants for identity is allowed to pull in.
+ALLOWED_MODULES = {"__future__", "constant_sorrow", "constant_sorrow.__about__", "constant_sorrow.constants"}
+
+# The dependencies deferred until first use.
+DEFERRED_MODULES = ["hashlib", "copy", "bytestring_splitter"]
+
+# Importing constants has measured at about a sixth of the cost of its deferred dependencies, so a third
+# leaves room for noise while still failing if the cold import cost roughly doubles.
+MAX_SHARE_OF_DEFERRED_IMPORT_COST = 1 / 3
+
+IDENTITY_ONLY_USE = """
+import sys
+already_imported = set(sys.modules)
+from constant_sorrow.constants import NOT_FOUND, NO_VALUE
+assert NOT_FOUND is not NO_VALUE
+print(",".join(sorted(set(sys.modules) - already_imported)))
+"""
+
+
+def _run(code, *options):
+    # Allow bytecode to be cached, as it would be in an installed package, so that we don't time compilation.
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    output = subprocess.check_output([sys.executable] + list(options) + ["-c", code],
+                                     cwd=REPO_ROOT, env=env, stderr=subprocess.STDOUT)
+    return output.decode()
+
+
+def _cumulative_import_time(importtime_output, module):
+    # Lines look like "import time:       685 |       1205 |   constant_sorrow"
+    for line in importtime_output.splitlines():
+        if line.startswith("import time:") and line.split("|")[-1].strip() == module:
+            return int(line.split("|")[1])
+    raise LookupError("{} was not imported".format(module))
+
+
+def test_lazy_attributes():
+    splitter = constant_sorrow.default_constant_splitter
+    assert splitter is constant_sorrow.default_constant_splitter
+    assert constant_sorrow.key_splitter is splitter
+
+    assert splitter.__class__ is constant_sorrow.BytestringSplitter
+
+    with pytest.raises(AttributeError):
+        constant_sorrow.this_is_not_an_attribute
+
+
+def test_package_namespace_exposes_nothing_new():
+    public_names = {name for name in dir(constant_sorrow) if not name.startswith("_")}
+    submodules = {"constants", "introspection", "utilities"}
+    lazy_attributes = {"BytestringSplitter", "default_constant_splitter", "key_splitter"}
+    assert public_names <= {"constant_or_bytes"} | submodules | lazy_attributes
+    assert "__LazyPackage" not in dir(constant_sorrow)
+
+
+def test_lazy_attributes_are_listed_before_first_access():
+    # A fresh process, so that none of them have been built yet.
+    code = "import constant_sorrow; print(sorted(set(dir(constant_sorrow)) - set(vars(constant_sorrow))))"
+    assert _run(code).strip() == str(["BytestringSplitter", "default_constant_splitter", "key_splitter"])
+
+
+def test_identity_use_imports_nothing_else():
+    newly_imported = set(_run(IDENTITY_ONLY_USE).strip().split(","))
+    assert newly_imported <= ALLOWED_MODULES
+
+
+def _while_hashing(constant_to_hash, in_another_thread, monkeypatch):
+    # Runs in_another_thread while a drain is part way through hashing constant_to_hash, giving it a moment to
+    # race the drain before letting the drain finish.  Returns the thread, to be joined once the drain is done.
+    from constant_sorrow.constants import hash_and_truncate
+    thread = threading.Thread(target=in_another_thread)
+
+    def hash_and_race(constant):
+        if constant is constant_to_hash and not thread.is_alive():
+            thread.start()
+            thread.join(timeout=0.1)
+        return hash_and_truncate(constant)
+    monkeypatch.setattr("constant_sorrow.constants.hash_and_truncate", hash_and_race)
+    return thread
+
+
+def test_constant_registered_during_a_drain_is_found_by_hash(monkeypatch):
+    from constant_sorrow import constant_or_bytes, constants
+    from constant_sorrow.constants import hash_and_truncate
+
+    constants.REGISTERED_BEFORE_DRAIN
+    thread = _while_hashing(constants.REGISTERED_BEFORE_DRAIN, lambda: constants.REGISTERED_DURING_DRAIN, monkeypatch)
+    assert constant_or_bytes(hash_and_truncate(constants.REGISTERED_BEFORE_DRAIN)) is constants.REGISTERED_BEFORE_DRAIN
+    thread.join()
+
+    assert constant_or_bytes(hash_and_truncate(constants.REGISTERED_DURING_DRAIN)) is constants.REGISTERED_DURING_DRAIN
+
+
+def test_lookup_during_a_drain_finds_the_constant_being_hashed(monkeypatch):
+    from constant_sorrow import constant_or_bytes, constants
+    from constant_sorrow.constants import hash_and_truncate
+
+    constants.BEING_HASHED
+    digest = hash_and_truncate(constants.BEING_HASHED)
+    found = []
+    thread = _while_hashing(constants.BEING_HASHED, lambda: found.append(constant_or_bytes(digest)), monkeypatch)
+    constant_or_bytes(b"not a constant's digest")  # Drains.
+    thread.join()
+
+    assert found == [constants.BEING_HASHED]
+    assert found[0] is constants.BEING_HASHED
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="-X importtime is new in Python 3.7")
+def test_cold_import_cost_has_not_regressed():
+    # Compare against the deferred dependencies, timed in the same interpreter, so that the check holds on
+    # machines of any speed.  Take the best of several runs, the first of which warms the bytecode cache.
+    code = "import constant_sorrow.constants; " + "; ".join("import " + module for module in DEFERRED_MODULES)
+    runs = [_run(code, "-X", "importtime") for _ in range(5)]
+
+    ours = min(_cumulative_import_time(run, "constant_sorrow.constants") for run in runs)
+    deferred = min(sum(_cumulative_import_time(run, module) for module in DEFERRED_MODULES) for run in runs)
+    assert ours < deferred * MAX_SHARE_OF_DEFERRED_IMPORT_COST
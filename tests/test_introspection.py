@@ -0,0 +1,105 @@
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+
+import pytest
+
+from constant_sorrow import constants, constant_or_bytes
+from constant_sorrow.constants import _constants_registry_by_name
+from constant_sorrow.introspection import registry_report, find_hash_collisions, _class_namespace
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_report_counts_and_memory():
+    constants.INTROSPECTED_THING
+    report = registry_report()
+
+    assert report["count"] == len(_constants_registry_by_name)
+    assert report["memory"]["total"] == sum(size for key, size in report["memory"].items() if key != "total")
+    assert report["memory"]["instances"] > 0
+
+    # Classes are measured by their real namespace dict, not the mappingproxy in front of it.
+    constant_class = type(constants.INTROSPECTED_THING)
+    namespace = _class_namespace(constant_class)
+    constant_class.set_constant_documentation("Added after finding the namespace.")
+    assert namespace["__doc__"] == "Added after finding the namespace."
+
+    # The whole report is machine-readable.
+    assert json.loads(json.dumps(report)) == report
+
+
+def test_report_does_not_grow_memory():
+    tracemalloc.start()
+    try:
+        # Warm up while tracing, so that imports, and freed objects which CPython keeps on free lists for reuse,
+        # aren't counted below.
+        for number in range(500):
+            getattr(constants, "UNMEASURED_{}".format(number))
+        registry_report()
+
+        # These have never been reported on, nor hashed.
+        for number in range(500, 1000):
+            getattr(constants, "UNMEASURED_{}".format(number))
+
+        before = tracemalloc.get_traced_memory()[0]
+        registry_report()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    # Reading each constant's __dict__, or hashing the awaiting constants into the registry, would cost tens of KB.
+    assert after - before < 1024
+
+
+def test_largest_representations():
+    constants.BIG_REPRESENTATION(b"x" * 10000)
+    constants.SMALL_REPRESENTATION(b"x")
+
+    largest = registry_report(largest=1)["largest_representations"]
+    assert largest == [{"name": "BIG_REPRESENTATION", "size": sys.getsizeof(b"x" * 10000)}]
+
+
+def test_never_used_constants():
+    constants.NEVER_CAST
+    constants.CAST_TO_BYTES
+    constants.CAST_TO_STR
+    constants.LOOKED_UP_BY_HASH
+
+    bytes(constants.CAST_TO_BYTES)
+    str(constants.CAST_TO_STR)
+
+    # Get the digest without casting.
+    from constant_sorrow.constants import hash_and_truncate
+    assert constant_or_bytes(hash_and_truncate(constants.LOOKED_UP_BY_HASH)) is constants.LOOKED_UP_BY_HASH
+
+    never_used = registry_report()["never_used"]
+    assert "NEVER_CAST" in never_used
+    assert "CAST_TO_BYTES" not in never_used
+    assert "CAST_TO_STR" not in never_used
+    assert "LOOKED_UP_BY_HASH" not in never_used
+
+
+def test_hash_collisions(monkeypatch):
+    assert find_hash_collisions() == {}
+
+    # Truncated digests colliding is vanishingly unlikely, so force every constant onto the same one.
+    from constant_sorrow import introspection
+    monkeypatch.setattr(introspection, "hash_and_truncate", lambda constant: b"\x00" * 8)
+    collisions = registry_report()["hash_collisions"]
+    assert collisions == {"00" * 8: sorted(_constants_registry_by_name)}
+
+
+def test_command_line_report():
+    output = subprocess.check_output([sys.executable, "-m", "constant_sorrow",
+                                      "--import", "tests._just_import_for_testing"], cwd=REPO_ROOT)
+    report = json.loads(output.decode())
+    assert set(report) == {"count", "memory", "largest_representations", "never_used", "hash_collisions"}
+
+
+def test_command_line_rejects_negative_largest():
+    from constant_sorrow.__main__ import main
+    with pytest.raises(SystemExit):
+        main(["--largest", "-1"])